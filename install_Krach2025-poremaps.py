@@ -8,12 +8,14 @@ Installs OpenMPI and poremaps, and updates the `.bashrc` file for environment se
 
 This script performs the following steps:
 1. Installs OpenMPI (if requested) and retrieves the compiler, executable path, and version.
-2. Installs poremaps using the OpenMPI compiler and executable.
+   poremaps is cloned in the background meanwhile.
+2. Builds poremaps using the OpenMPI compiler and executable.
 3. Updates the `.bashrc` file to include the Python virtual environment and OpenMPI paths.
 
 Functions Used:
 - `run_ompi_install`: Installs OpenMPI and returns the compiler, executable path, and version.
-- `run_pormaps_install`: Installs poremaps using the provided OpenMPI compiler and executable.
+- `clone_poremaps`: Clones poremaps, runs concurrently with `run_ompi_install`.
+- `build_poremaps`: Builds poremaps using the provided OpenMPI compiler and executable.
 
 Environment Variables:
 - `GET_OPENMPI`: Boolean flag to determine if OpenMPI should be installed.
@@ -27,11 +29,21 @@ Output:
 """
 
 # HEADER --------------------------------------------------------------------------------
+import concurrent.futures
+import functools
+import math
 import os
+import re
+import stat
 import sys
 import subprocess
+import shutil
 import requests
-import tarfile
+import threading
+import time
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 # END HEADER ----------------------------------------------------------------------------
 
 # Global variable for verbose output, etc....
@@ -39,6 +51,10 @@ GET_OPENMPI  = True
 VERBOSE      = True
 POREMAPSTEST = True
 
+# Persistent cache for downloads, configure results and ccache, e.g. a BuildKit
+# cache mount; falls back to the OpenMPI source directory if not writable
+CACHE_DIR    = '/cache'
+
 # We use https to clone
 POREMAPS_GIT_URL = 'https://git.rwth-aachen.de/david.krach/poremaps.git'
 cwd = os.getcwd()
@@ -50,13 +66,293 @@ os.makedirs(ompi_src, exist_ok=True)
 ompi_src = os.path.join(cwd, ompi_src)
 
 
+def _available_cpus():
+    """
+    Returns the number of CPUs this process may actually use.
+
+    `os.cpu_count()` reports the host's CPUs. Inside a container the 
+    usable share is limited by the CPU affinity mask and by the cgroup 
+    CPU quota (`cpu.max` for cgroup v2, `cpu.cfs_quota_us` / 
+    `cpu.cfs_period_us` for cgroup v1), so the smaller of both is used.
+
+    Returns:
+        int: Number of usable CPUs (at least 1).
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        cpus = os.cpu_count() or 1
+
+    quota = period = None
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()[:2]
+    except (OSError, ValueError):
+        # cgroup v1: a quota of -1 means unlimited
+        for cg in ('/sys/fs/cgroup/cpu', '/sys/fs/cgroup/cpu,cpuacct'):
+            try:
+                with open(os.path.join(cg, 'cpu.cfs_quota_us')) as f:
+                    cg_quota = f.read().strip()
+                with open(os.path.join(cg, 'cpu.cfs_period_us')) as f:
+                    cg_period = f.read().strip()
+            except OSError:
+                continue
+            # Only use the quota if both files could be read
+            quota, period = cg_quota, cg_period
+            break
+
+    try:
+        if quota not in (None, 'max', '-1') and int(period) > 0:
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (TypeError, ValueError):
+        pass
+
+    return max(1, cpus)
+
+
+def _make_jobs(max_jobs = 32):
+    """
+    Returns the number of parallel jobs passed to `make -j`.
+
+    Uses the number of CPUs available to the container (see 
+    `_available_cpus`), capped at `max_jobs` to avoid memory 
+    exhaustion and thrashing on very large hosts.
+
+    Args:
+        max_jobs (int, optional): Upper bound for the number of jobs.
+                                  Defaults to 32.
+
+    Returns:
+        int: Number of parallel make jobs (at least 1).
+    """
+    return max(1, min(_available_cpus(), max_jobs))
+
+
+def _enable_ccache(_cache_dir):
+    """
+    Routes all following C/C++ compiler calls through `ccache`.
+
+    Prepends ccache's compiler masquerade directory (`gcc`, `g++`, ... 
+    symlinks to `ccache`) to `PATH`, so OpenMPI and poremaps builds 
+    hit the compiler cache without recording `ccache` in OpenMPI's 
+    wrapper compilers. The cache is kept in `<_cache_dir>/ccache` if 
+    `_cache_dir` is writable.
+
+    Args:
+        _cache_dir (str): Persistent cache directory, e.g. `CACHE_DIR`.
+
+    Returns:
+        bool: `True` if ccache is used, `False` if it is not available.
+    """
+    ccache_bin = '/usr/lib/ccache'
+    if not shutil.which('ccache') or not os.path.isdir(ccache_bin):
+        print('### ccache not found, compiling without cache ###')
+        return False
+
+    os.environ['PATH'] = f"{ccache_bin}{os.pathsep}{os.environ.get('PATH', '')}"
+    if os.access(_cache_dir, os.W_OK):
+        os.environ['CCACHE_DIR'] = os.path.join(_cache_dir, 'ccache')
+    return True
+
+
+def _download_tarball(_url, _dst, _sink = None, chunk_size = 1 << 20, attempts = 5):
+    """
+    Downloads a file over a keep-alive session with retries and 
+    resumes interrupted downloads via HTTP `Range` requests.
+
+    Data is written to `<_dst>.part` and renamed to `_dst` once the 
+    download is complete, i.e. once its size matches the size announced 
+    by the server. A leftover `.part` file of a previous run is resumed instead of 
+    downloaded again, and an existing `_dst` is reused as is. If 
+    `_sink` is given, every byte of the file is additionally written 
+    to it in order, which allows extracting while downloading (see 
+    `_extract_tarball`).
+
+    Args:
+        _url (str): URL of the file to download.
+        _dst (str): Path of the downloaded file.
+        _sink (file-like, optional): Writable binary stream that 
+                                     receives a copy of the file. 
+                                     Defaults to None.
+        chunk_size (int, optional): Size of the blocks read from the 
+                                    network in bytes. Defaults to 1 MiB.
+        attempts (int, optional): Number of attempts to (re)start the 
+                                  transfer after a broken or truncated 
+                                  connection. Defaults to 5.
+
+    Returns:
+        str: Path of the downloaded file (`_dst`).
+
+    Raises:
+        requests.HTTPError: If the server answers with an error status.
+        RuntimeError: If a resumed transfer is not supported by the 
+                      server after data was already passed to `_sink`.
+        Exception: Network errors, including truncated transfers, are 
+                   re-raised once all attempts failed.
+    """
+    def _total_size(response):
+        # 206: "bytes <first>-<last>/<total>", 416: "bytes */<total>"
+        content_range = response.headers.get('Content-Range', '')
+        if '/' in content_range:
+            total = content_range.rsplit('/', 1)[1].strip()
+            return int(total) if total.isdigit() else None
+        if response.status_code == 200 and 'Content-Length' in response.headers:
+            return int(response.headers['Content-Length'])
+        return None
+
+    if os.path.isfile(_dst):
+        if _sink is not None:
+            with open(_dst, 'rb') as f:
+                shutil.copyfileobj(f, _sink, chunk_size)
+        return _dst
+
+    part = f'{_dst}.part'
+    offset = os.path.getsize(part) if os.path.isfile(part) else 0
+    # Bytes of the file already passed on to _sink
+    fed = 0
+
+    session = requests.Session()
+    retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+    session.mount('https://', HTTPAdapter(pool_connections=1, max_retries=retry))
+
+    with session, open(part, 'ab') as out:
+
+        def _restart(reason):
+            # Drop the .part file, only possible before data reached _sink
+            nonlocal offset
+            if fed:
+                raise RuntimeError(f'{_url}: {reason}, cannot restart the download')
+            print(f'### {reason.upper()}, RESTARTING DOWNLOAD ###')
+            out.seek(0)
+            out.truncate()
+            offset = 0
+
+        for attempt in range(attempts):
+            headers = {'Range': f'bytes={offset}-'} if offset else {}
+            try:
+                with session.get(_url, headers=headers, stream=True, timeout=60) as response:
+                    total = _total_size(response)
+                    if response.status_code == 416:
+                        # Nothing left to fetch; only valid if the .part
+                        # file has exactly the size of the remote file
+                        if total != offset:
+                            _restart(f'.part file has {offset} bytes, remote file {total}')
+                            continue
+                    else:
+                        response.raise_for_status()
+                        if offset and response.status_code != 206:
+                            _restart('server ignored the range request')
+
+                    # Pass data of a previous run on before new data
+                    if _sink is not None and fed < offset:
+                        out.flush()
+                        with open(part, 'rb') as f:
+                            f.seek(fed)
+                            shutil.copyfileobj(f, _sink, chunk_size)
+                        fed = offset
+
+                    if response.status_code != 416:
+                        while True:
+                            chunk = response.raw.read(chunk_size)
+                            if not chunk:
+                                break
+                            out.write(chunk)
+                            if _sink is not None:
+                                _sink.write(chunk)
+                            offset += len(chunk)
+                            fed = offset
+
+                    # Older urllib3 versions do not enforce Content-Length,
+                    # a dropped connection then looks like a regular EOF
+                    if total is not None and offset != total:
+                        raise requests.ConnectionError(
+                            f'incomplete download, got {offset} of {total} bytes')
+                break
+            except (requests.ConnectionError, requests.Timeout, urllib3.exceptions.HTTPError) as e:
+                if attempt == attempts - 1:
+                    raise
+                print(f'### DOWNLOAD INTERRUPTED ({e}), RESUMING AT {offset} BYTES ###')
+                time.sleep(0.5 * 2 ** attempt)
+        else:
+            raise RuntimeError(f'{_url}: download did not complete after {attempts} attempts')
+
+    os.replace(part, _dst)
+    return _dst
+
+
+def _extract_tarball(_fetch, _path = ".", chunk_size = 1 << 20):
+    """
+    Extracts a gzipped tarball with the system's `tar` while it is 
+    still being downloaded.
+
+    A background thread runs `_fetch`, which writes the archive into 
+    an OS pipe, while `tar` decompresses and extracts from the read 
+    end. Network stalls and decompression therefore overlap instead 
+    of running strictly one after another. Decompression uses the 
+    first available of `igzip` (Intel ISA-L), `pigz` and `tar -z` (gzip).
+
+    Args:
+        _fetch (callable): Called with a writable binary stream as its 
+                           only argument; writes the `.tar.gz` archive 
+                           to it, e.g. a wrapper of `_download_tarball`.
+        _path (str, optional): Directory to extract into. Defaults to ".".
+        chunk_size (int, optional): Buffer size of the pipe's write end 
+                                    in bytes. Defaults to 1 MiB.
+
+    Raises:
+        subprocess.CalledProcessError: If `tar` fails to extract the archive.
+        Exception: Any error raised by `_fetch` is re-raised to the caller, 
+                   in preference to the resulting `tar` failure.
+    """
+    for gunzip in ('igzip', 'pigz'):
+        if shutil.which(gunzip):
+            tar_cmd = ['tar', f'--use-compress-program={gunzip}', '-xf', '-', '-C', _path]
+            break
+    else:
+        tar_cmd = ['tar', '-xzf', '-', '-C', _path]
+
+    read_fd, write_fd = os.pipe()
+    errors = []
+
+    def _producer():
+        try:
+            with open(write_fd, 'wb', buffering=chunk_size) as sink:
+                _fetch(sink)
+        except BrokenPipeError:
+            # tar stopped early, it reports its own errors
+            pass
+        except Exception as e:
+            errors.append(e)
+
+    producer = threading.Thread(target=_producer, daemon=True)
+    producer.start()
+    tar_error = None
+    try:
+        subprocess.run(tar_cmd, stdin=read_fd, check=True)
+    except subprocess.CalledProcessError as e:
+        tar_error = e
+    finally:
+        os.close(read_fd)
+        producer.join()
+
+    # A failing _fetch makes tar fail on the truncated input as well,
+    # report the cause rather than tar's exit status
+    if errors:
+        raise errors[0]
+    if tar_error is not None:
+        raise tar_error
+
+
 def run_ompi_install(_GET_OMPI, _ompi_src, ompi_version = "5.0.9"):
     """
     Installs OpenMPI from source if requested, or falls back to 
     the system's OpenMPI. This function automates the process of 
     downloading, extracting, configuring, building, and installing 
     OpenMPI. If installation fails or is not requested, it 
-    defaults to the system's OpenMPI.
+    defaults to the system's OpenMPI. An existing installation of 
+    the same version is reused, the tarball and configure results 
+    are kept in `CACHE_DIR` for later runs.
 
     Args:
         _GET_OMPI (bool):
@@ -102,19 +398,33 @@ def run_ompi_install(_GET_OMPI, _ompi_src, ompi_version = "5.0.9"):
         # Construct the download URL for the specified OpenMPI version
         ompi_url = f"https://download.open-mpi.org/release/open-mpi/v{ompi_version[0]}.{ompi_version[2]}/openmpi-{ompi_version}.tar.gz"
 
-        try:
-            # Download the tarball
-            print(f'### DOWNLOADING OpenMPI {ompi_version} ###')
-            tarball = requests.get(ompi_url, stream=True)
+        # Set paths for the OpenMPI compiler and execution wrapper
+        ompi_compiler = os.path.join(_ompi_src, f"openmpi-{ompi_version}/build/bin/mpiCC")
+        ompi_exec = os.path.join(_ompi_src, f"openmpi-{ompi_version}/build/bin/mpirun")
+
+        # Skip download, configure and build if this version is already installed
+        if os.path.isfile(ompi_compiler) and os.path.isfile(ompi_exec):
+            print(f'### Using already installed OpenMPI {ompi_version} ###')
+            return ompi_compiler, ompi_exec, ompi_version
 
-            # Extract the tarball
-            print(f'### EXTRACTING TARBALL ###')
-            file = tarfile.open(fileobj=tarball.raw, mode="r|gz")
-            file.extractall(path=".")
+        cache_dir = CACHE_DIR if os.access(CACHE_DIR, os.W_OK) else _ompi_src
+        configure_cache = os.path.join(cache_dir, f'ompi-{ompi_version}.cache')
 
-            # Set paths for the OpenMPI compiler and execution wrapper
-            ompi_compiler = os.path.join(os.getcwd(), f"openmpi-{ompi_version}/build/bin/mpiCC")
-            ompi_exec = os.path.join(os.getcwd(), f"openmpi-{ompi_version}/build/bin/mpirun")
+        try:
+            # Download the tarball and extract it while it is being downloaded
+            print(f'### DOWNLOADING & EXTRACTING OpenMPI {ompi_version} ###')
+            tarball = os.path.join(cache_dir, f'openmpi-{ompi_version}.tar.gz')
+            try:
+                _extract_tarball(lambda sink: _download_tarball(ompi_url, tarball, sink), ".")
+            except subprocess.CalledProcessError:
+                # The download completed but tar rejected it, do not let the
+                # broken tarball persist in the cache. Network errors keep
+                # the .part file, so the next build resumes the download.
+                for cached in (tarball, f'{tarball}.part'):
+                    if os.path.isfile(cached):
+                        print(f'### DISCARDING CACHED {cached} ###')
+                        os.remove(cached)
+                raise
 
             # Navigate to the OpenMPI source directory
             os.chdir(f'openmpi-{ompi_version}')
@@ -123,19 +433,44 @@ def run_ompi_install(_GET_OMPI, _ompi_src, ompi_version = "5.0.9"):
             os.makedirs('build', exist_ok=True)
             os.chdir('build')
 
-            # Configure OpenMPI
-            print(f'### CONFIGURING OpenMPI ###')
-            if VERBOSE:
-                os.system(f'../configure --prefix=$PWD')
-            else:
-                os.system(f'../configure --prefix=$PWD > ompi_config.log')
-
-            # Build and install OpenMPI
-            print(f'### BUILDING & INSTALLING OpenMPI ###')
-            if VERBOSE:
-                os.system(f'make -j4; make install')
-            else:
-                os.system(f'make -j4 > ompi_build.log; make install > ompi_install.log')
+            def _run(cmd, log_name):
+                if VERBOSE:
+                    subprocess.run(cmd, check=True)
+                else:
+                    with open(log_name, 'w') as log:
+                        subprocess.run(cmd, stdout=log, check=True)
+
+            # Configure, build and install OpenMPI; `check=True` aborts on
+            # the first failing step and raises CalledProcessError
+            print(f'### CONFIGURING, BUILDING & INSTALLING OpenMPI ###')
+            # poremaps only needs the C/C++ MPI wrappers (`mpiCC`), skip
+            # everything else to save configure probes and compile time.
+            # `--cache-file` reuses configure results of previous runs.
+            configure_cmd = ['../configure', f'--prefix={os.getcwd()}',
+                             f'--cache-file={configure_cache}',
+                             '--disable-oshmem', '--disable-mpi-fortran', '--disable-static',
+                             '--without-ofi', '--without-cuda',
+                             'CFLAGS=-O2 -pipe', 'CXXFLAGS=-O2 -pipe']
+            make_cmd = ['make', f'-j{_make_jobs()}', 'install']
+            try:
+                try:
+                    _run(configure_cmd, 'ompi_config.log')
+                except subprocess.CalledProcessError:
+                    # A cache written with different compilers or flags makes
+                    # configure bail out, retry once without it
+                    if not os.path.isfile(configure_cache):
+                        raise
+                    print(f'### DISCARDING CONFIGURE CACHE {configure_cache} ###')
+                    os.remove(configure_cache)
+                    _run(configure_cmd, 'ompi_config.log')
+                _run(make_cmd, 'ompi_build.log')
+            except Exception:
+                # Stale cached configure results (e.g. after a base image
+                # upgrade) can also break the build, start clean next time
+                if os.path.isfile(configure_cache):
+                    print(f'### DISCARDING CONFIGURE CACHE {configure_cache} ###')
+                    os.remove(configure_cache)
+                raise
 
         except Exception as e:
             # Fall back to system OpenMPI if installation fails
@@ -152,12 +487,14 @@ def run_ompi_install(_GET_OMPI, _ompi_src, ompi_version = "5.0.9"):
     return ompi_compiler, ompi_exec, ompi_version
 
 
+@functools.lru_cache(maxsize=None)
 def _ompi_sanity(_exec):
     """
     Perform sanity checks on an executable file to ensure it 
     exists and is executable.  If the file does not exist 
     or is not executable, the function will terminate the 
-    program with an appropriate error message.
+    program with an appropriate error message. Successful 
+    checks are cached, repeated calls for the same path are free.
 
     Args:
         _exec (str): The path to the executable file to be checked.
@@ -172,107 +509,122 @@ def _ompi_sanity(_exec):
         # Exits with an error if "/usr/bin/mpirun" does not exist 
         or is not executable.
     """
+    # A single stat() serves both checks
     try:
-        if not os.path.isfile(_exec):
+        st = os.stat(_exec)
+        if not stat.S_ISREG(st.st_mode):
             raise FileNotFoundError(f"{_exec} does not exist")
     except Exception as e:
         sys.exit(f"ERROR: {_exec} does not exist\n error {e}")
 
     try:
-        if not os.access(_exec, os.X_OK):
+        if not st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH):
             raise PermissionError(f"{_exec} is not executable")
     except Exception as e:
         sys.exit(f'ERROR: {_exec} is not executable\n error {e}')
 
-def run_pormaps_install(_ompi_compiler, _ompi_exec, _poremaps_src, poremaps_git_url):
+def clone_poremaps(poremaps_git_url, _poremaps_src):
     """
+    Clones the poremaps Git repository into `<_poremaps_src>/poremaps`.
+
+    The clone does not depend on OpenMPI and does not change the 
+    working directory, so it can safely run in a background thread 
+    while OpenMPI is built. An existing clone is reused.
+
+    Args:
+        poremaps_git_url (str): Git repository URL for poremaps.
+        _poremaps_src (str): Path to the directory where poremaps will be installed.
+
+    Returns:
+        str: Path to the cloned poremaps repository.
+
+    Raises:
+        SystemExit: If the Git repository cannot be cloned.
     """
-    _ompi_sanity(_ompi_compiler)
-    _ompi_sanity(_ompi_exec)
-    os.chdir(_poremaps_src)
-    
+    poremaps_dir = os.path.join(_poremaps_src, 'poremaps')
+    if os.path.isdir(os.path.join(poremaps_dir, '.git')):
+        print(f'### Using existing clone in {poremaps_dir} ###')
+        return poremaps_dir
+
     try:
-        os.system(f'git clone {poremaps_git_url}')
+        # Clone only the tip of the default branch, the build needs no history
+        subprocess.run(['git', 'clone', '--depth=1', poremaps_git_url, poremaps_dir], check=True)
     except Exception as e:
-        sys.exit(f'ERROR: cloning {poremaps_git_url} failed.\n error-> {e}')
+        sys.exit(f'ERROR: Cloning {poremaps_git_url} failed.\nError: {e}')
 
-    os.chdir('poremaps/src')
-    # Replace the compiler exec in the makefile
-    os.system(f"sed -i 's|CLINKER=.*|CLINKER={_ompi_compiler}|' makefile")
-    os.system('make')
+    return poremaps_dir
 
 
-def run_pormaps_install(_ompi_compiler, _ompi_exec, _poremaps_src, poremaps_git_url):
+def build_poremaps(_ompi_compiler, _ompi_exec, _poremaps_src):
     """
-    Installs the poremaps software from a Git repository and compiles it using OpenMPI.
+    Compiles an already cloned poremaps repository using OpenMPI.
 
     This function performs the following steps:
     1. Validates the OpenMPI compiler and executable paths.
-    2. Changes the working directory to the specified poremaps source directory.
-    3. Clones the poremaps repository from the provided Git URL.
-    4. Navigates into the poremaps source directory.
-    5. Updates the Makefile to use the specified OpenMPI compiler.
-    6. Compiles the poremaps software using the updated Makefile.
+    2. Navigates into the poremaps source directory.
+    3. Updates the Makefile to use the specified OpenMPI compiler.
+    4. Compiles the poremaps software using the updated Makefile.
 
     Args:
         _ompi_compiler (str): Path to the OpenMPI compiler (e.g., `mpicc`).
         _ompi_exec (str): Path to the OpenMPI executable (e.g., `mpiexec`).
-        _poremaps_src (str): Path to the directory where poremaps will be installed.
-        poremaps_git_url (str): Git repository URL for poremaps.
+        _poremaps_src (str): Path to the directory where poremaps is cloned 
+                             (see `clone_poremaps`).
 
     Raises:
-        SystemExit: If the Git repository cannot be 
-                    cloned or if the Makefile update fails.
-        Exception: For any unexpected errors during the installation process.
+        SystemExit: If the OpenMPI compiler or executable is not usable.
 
     Note:
-        - Ensure the system has `git`, `make`, and OpenMPI installed.
+        - Ensure the system has `make` and OpenMPI installed.
         - The function assumes the Makefile contains a `CLINKER` variable.
     """
-
-
     # Validate OpenMPI compiler and executable paths
     _ompi_sanity(_ompi_compiler)
     _ompi_sanity(_ompi_exec)
 
-    # Change to the specified poremaps source directory
-    os.chdir(_poremaps_src)
-
-    try:
-        # Clone the poremaps repository
-        os.system(f'git clone {poremaps_git_url}')
-    except Exception as e:
-        sys.exit(f'ERROR: Cloning {poremaps_git_url} failed.\nError: {e}')
-
     # Navigate into the poremaps source directory
-    os.chdir('poremaps/src')
+    os.chdir(os.path.join(_poremaps_src, 'poremaps/src'))
 
     # Update the Makefile to use the specified OpenMPI compiler
-    os.system(f"sed -i 's|CLINKER=.*|CLINKER={_ompi_compiler}|' makefile")
+    with open('makefile') as f:
+        makefile = f.read()
+    makefile = re.sub(r'CLINKER=.*', lambda m: f'CLINKER={_ompi_compiler}', makefile)
+    with open('makefile', 'w') as f:
+        f.write(makefile)
 
     # Compile poremaps using the updated Makefile
-    os.system('make')
+    subprocess.run(['make', f'-j{_make_jobs()}'], check=True)
+
+
+# Cache compiler output of the OpenMPI and poremaps builds
+_enable_ccache(CACHE_DIR)
 
+# Clone poremaps in the background while OpenMPI is installed, the clone
+# does not depend on OpenMPI, only the build of poremaps does
+with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+    poremaps_clone = executor.submit(clone_poremaps, POREMAPS_GIT_URL, poremaps_src)
 
-# Install OpenMPI and retrieve the compiler, executable, and version
-ompi_compiler, ompi_exec, ompi_version = run_ompi_install(GET_OPENMPI, ompi_src)
-print(ompi_compiler, ompi_exec)
+    # Install OpenMPI and retrieve the compiler, executable, and version
+    ompi_compiler, ompi_exec, ompi_version = run_ompi_install(GET_OPENMPI, ompi_src)
+    print(ompi_compiler, ompi_exec)
 
-# Install poremaps using the OpenMPI compiler and executable
-pormaps_success = run_pormaps_install(ompi_compiler, ompi_exec, poremaps_src, POREMAPS_GIT_URL)
+    # Wait for the clone, re-raises its errors
+    poremaps_clone.result()
+
+# Build poremaps using the OpenMPI compiler and executable
+pormaps_success = build_poremaps(ompi_compiler, ompi_exec, poremaps_src)
 
 # Add the poremaps virtual environment to `.bashrc` for automatic activation
-os.system(f"echo 'source /poremaps/venv/poremaps/bin/activate' >> /poremaps/.bashrc")
+bashrc_lines = ['source /poremaps/venv/poremaps/bin/activate']
 
 # If OpenMPI was installed and the executable is not the system default,
 # update `.bashrc` to include OpenMPI's binary and library paths
 if GET_OPENMPI and ompi_exec != '/usr/bin/mpirun':
     # Add OpenMPI's binary directory to the PATH environment variable
-    os.system(f"echo 'export PATH={ompi_src}/openmpi-{ompi_version}/build/bin:$PATH' >> /poremaps/.bashrc")
+    bashrc_lines.append(f'export PATH={ompi_src}/openmpi-{ompi_version}/build/bin:$PATH')
     # Add OpenMPI's library directory to the LD_LIBRARY_PATH environment variable
-    os.system(f"echo 'export LD_LIBRARY_PATH={ompi_src}/openmpi-{ompi_version}/build/lib:$LD_LIBRARY_PATH' >> /poremaps/.bashrc")
-
-
-
-
+    bashrc_lines.append(f'export LD_LIBRARY_PATH={ompi_src}/openmpi-{ompi_version}/build/lib:$LD_LIBRARY_PATH')
 
+# Append all lines with a single write
+with open('/poremaps/.bashrc', 'a') as f:
+    f.write(''.join(f'{line}\n' for line in bashrc_lines))